@@ -1,23 +1,38 @@
 \
 import os
 import io
+import asyncio
 import csv
-import json
+import hashlib
 import math
+import mimetypes
+import re
 import time
 import base64
 import string
+import functools
 import typing as t
+from collections.abc import MutableMapping
+from contextlib import asynccontextmanager
 from datetime import date, datetime, timedelta
-
-import requests
-from fastapi import FastAPI, HTTPException, Depends, Query, Body
+from email.utils import formatdate
+from urllib.parse import quote
+from xml.sax.saxutils import escape
+
+import httpx
+import orjson
+from cachetools import LRUCache, TTLCache
+from cachetools.keys import hashkey
+from fastapi import FastAPI, HTTPException, Depends, Query, Body, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from fastapi.responses import ORJSONResponse, PlainTextResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field, field_validator
 from pydantic_settings import BaseSettings
-from sqlalchemy import create_engine, Column, Integer, String, Float, Date, DateTime, Text
+from sqlalchemy import create_engine, event, func, inspect, insert, select, update, delete, text, make_url, Column, Integer, String, Float, Date, DateTime, Text, JSON, Index
 from sqlalchemy.orm import declarative_base, sessionmaker, Session
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateIndex
 
 # ---------------- Settings ----------------
 class Settings(BaseSettings):
@@ -29,14 +44,53 @@ class Settings(BaseSettings):
 settings = Settings()
 
 # ---------------- DB ----------------
-engine = create_engine(settings.DATABASE_URL, connect_args={"check_same_thread": False} if settings.DATABASE_URL.startswith("sqlite") else {})
+db_url = make_url(settings.DATABASE_URL)
+engine_kwargs: dict[str, t.Any] = {}
+if db_url.get_backend_name() == "sqlite":
+    engine_kwargs["connect_args"] = {"check_same_thread": False}
+    if db_url.database in (None, "", ":memory:"):
+        # in-memory DB lives only as long as its connection; share a single one
+        engine_kwargs["poolclass"] = StaticPool
+else:
+    # sized for concurrent async handlers; LIFO reuses the warmest connection,
+    # pre_ping/recycle drop connections the server or a fork has left stale
+    engine_kwargs.update(pool_size=20, max_overflow=40, pool_pre_ping=True, pool_recycle=1800, pool_use_lifo=True)
+if db_url.get_driver_name() == "psycopg2":
+    # fold executemany() into multi-row VALUES pages for batched inserts
+    engine_kwargs["executemany_mode"] = "values_plus_batch"
+engine = create_engine(
+    db_url,
+    json_serializer=lambda obj: orjson.dumps(obj).decode(),
+    json_deserializer=orjson.loads,
+    **engine_kwargs,
+)
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine, "connect")
+    def _sqlite_pragmas(dbapi_conn, _record):
+        # WAL lets readers run alongside writers; NORMAL skips the per-commit fsync
+        # (still durable across app crashes), mmap/cache keep hot pages in memory.
+        cur = dbapi_conn.cursor()
+        for pragma in (
+            "journal_mode=WAL",
+            "synchronous=NORMAL",
+            "temp_store=MEMORY",
+            "mmap_size=268435456",
+            "cache_size=-65536",
+            "foreign_keys=ON",
+        ):
+            cur.execute(f"PRAGMA {pragma}")
+        cur.close()
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 class WeatherRequest(Base):
     __tablename__ = "weather_requests"
-    id = Column(Integer, primary_key=True, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    id = Column(Integer, primary_key=True)
+    # assigned by the database; default= renders now() into the INSERT itself so
+    # tables created before the server default existed keep working. SQLite stores
+    # CURRENT_TIMESTAMP (UTC); Postgres uses timestamptz, legacy columns migrated below.
+    created_at = Column(DateTime(timezone=True), default=func.now(), server_default=func.now(), nullable=False)
     location_input = Column(String, nullable=False)
     resolved_name = Column(String, nullable=True)
     latitude = Column(Float, nullable=False)
@@ -44,17 +98,59 @@ class WeatherRequest(Base):
     date_from = Column(Date, nullable=False)
     date_to = Column(Date, nullable=False)
     provider = Column(String, default="open-meteo", nullable=False)
-    weather_json = Column(Text, nullable=False)  # store daily temps & current weather
+    # store daily temps & current weather; decoded once at row load. Keeps the
+    # original column name: SQLite reads the legacy TEXT column as JSON as-is,
+    # Postgres needs the jsonb conversion below.
+    weather = Column("weather_json", JSON().with_variant(JSONB, "postgresql"), nullable=False)
     notes = Column(Text, nullable=True)
 
-Base.metadata.create_all(bind=engine)
+Index("ix_wr_created_at", WeatherRequest.created_at.desc())
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+Base.metadata.create_all(bind=engine)
+if engine.dialect.name == "postgresql":
+    _cols = {c["name"]: c["type"] for c in inspect(engine).get_columns(WeatherRequest.__tablename__)}
+    with engine.begin() as conn:
+        # Postgres only decodes json/jsonb columns; convert a TEXT weather_json left by older releases
+        if isinstance(_cols["weather_json"], Text):
+            conn.execute(text("ALTER TABLE weather_requests ALTER COLUMN weather_json TYPE jsonb USING weather_json::jsonb"))
+        # older releases stored naive utcnow() in a timestamp column; make it timestamptz so
+        # those rows and func.now() defaults are the same instants whatever the server TimeZone
+        if not getattr(_cols["created_at"], "timezone", False):
+            conn.execute(text("ALTER TABLE weather_requests ALTER COLUMN created_at TYPE timestamptz USING created_at AT TIME ZONE 'UTC'"))
+# create_all skips indexes on tables that already exist; add any new ones. IF [NOT]
+# EXISTS keeps this safe when several workers import the app at once.
+with engine.begin() as conn:
+    for _index in WeatherRequest.__table__.indexes:
+        conn.execute(CreateIndex(_index, if_not_exists=True))
+    # Secondary indexes on the primary key (ascending or descending) only slow writes:
+    # ORDER BY id in either direction walks the PK / rowid b-tree directly.
+    for _name in ("ix_weather_requests_id", "ix_weather_requests_id_desc"):
+        conn.execute(text(f"DROP INDEX IF EXISTS {_name}"))
+
+class DBSessionMiddleware:
+    """Close the request's session, if get_db opened one, once the response
+       (including any streamed body) has been sent."""
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        state = scope.setdefault("state", {})
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            db = state.pop("db", None)
+            if db is not None:
+                await asyncio.to_thread(db.close)
+
+async def get_db(request: Request) -> Session:
+    # opened on first use, so routes that never touch the DB pay nothing
+    db = getattr(request.state, "db", None)
+    if db is None:
+        db = request.state.db = SessionLocal()
+    return db
 
 # ---------------- Pydantic Schemas ----------------
 class CreateRequest(BaseModel):
@@ -89,36 +185,116 @@ class RequestOut(BaseModel):
     weather: dict
     notes: str | None
 
+# columns backing RequestOut, for Core queries that bypass ORM entity loading
+REQUEST_OUT_COLUMNS = (
+    WeatherRequest.id,
+    WeatherRequest.created_at,
+    WeatherRequest.location_input,
+    WeatherRequest.resolved_name,
+    WeatherRequest.latitude,
+    WeatherRequest.longitude,
+    WeatherRequest.date_from,
+    WeatherRequest.date_to,
+    WeatherRequest.provider,
+    WeatherRequest.weather,
+    WeatherRequest.notes,
+)
+
 # ---------------- Utilities ----------------
+# used with fullmatch: "$" alone would also accept a trailing newline
+LATLON_RE = re.compile(r"\s*(-?\d+(?:\.\d+)?)\s*,\s*(-?\d+(?:\.\d+)?)\s*")
+ZIP_RE = re.compile(r"\d{5}")
+
 def parse_latlon(s: str) -> tuple[float, float] | None:
-    try:
-        if "," in s:
-            a, b = s.split(",", 1)
-            return float(a.strip()), float(b.strip())
-    except Exception:
-        return None
+    m = LATLON_RE.fullmatch(s)
+    if m:
+        return float(m[1]), float(m[2])
     return None
 
 def is_us_zip(s: str) -> bool:
-    return s.isdigit() and len(s) == 5
+    return ZIP_RE.fullmatch(s) is not None
 
 def clamp_days(dfrom: date, dto: date, max_days: int = 31):
     delta = (dto - dfrom).days + 1
     if delta > max_days:
         raise HTTPException(status_code=400, detail=f"Date range too large ({delta} days). Max {max_days} days.")
 
-def geocode(location: str) -> tuple[str, float, float]:
+def async_cached(cache: MutableMapping, key: t.Callable[..., t.Hashable] = hashkey):
+    """Memoize a coroutine function into `cache`. None results (lookup misses /
+       upstream failures) and exceptions are not cached."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            k = key(*args, **kwargs)
+            try:
+                return cache[k]
+            except KeyError:
+                pass
+            value = await fn(*args, **kwargs)
+            if value is not None:
+                cache[k] = value
+            return value
+        return wrapper
+    return decorator
+
+def single_flight(key: t.Callable[..., t.Hashable] = hashkey):
+    """Coalesce concurrent calls to a coroutine function: while a call for a key is
+       in flight, later callers await the same task instead of starting another.
+       The shared task is shielded so one caller cancelling does not abort it for the rest."""
+    def decorator(fn):
+        inflight: dict[t.Hashable, asyncio.Task] = {}
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            k = key(*args, **kwargs)
+            task = inflight.get(k)
+            if task is None:
+                task = asyncio.ensure_future(fn(*args, **kwargs))
+                inflight[k] = task
+                task.add_done_callback(lambda _: inflight.pop(k, None))
+            return await asyncio.shield(task)
+        return wrapper
+    return decorator
+
+def weather_key(lat: float, lon: float, start: date, end: date) -> t.Hashable:
+    return hashkey(round(lat, 3), round(lon, 3), start.isoformat(), end.isoformat())
+
+# ---------------- HTTP client ----------------
+# Shared async client, opened/closed by the app lifespan so every handler reuses
+# the same connection pool instead of blocking a worker thread per upstream call.
+USER_AGENT = "WeatherWise/1.0 (+https://github.com/dslee01/WeatherWise)"
+client: httpx.AsyncClient | None = None
+
+# ---------------- Caches ----------------
+# Geocoding and settled archive data never change; forecasts, wiki extracts and the
+# most recent archive days (published with a lag, null until then) drift.
+ARCHIVE_SETTLE_DAYS = 7
+GEOCODE_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=7 * 86400)
+REVERSE_GEOCODE_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=7 * 86400)
+WIKI_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+ARCHIVE_CACHE: LRUCache = LRUCache(maxsize=4096)
+RECENT_ARCHIVE_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=3600)
+FORECAST_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=600)
+
+async def geocode(location: str) -> tuple[str, float, float]:
+    # normalize once so the cache, the in-flight map and the lookup all see the same string
+    return await _geocode(location.strip().lower())
+
+@async_cached(GEOCODE_CACHE)
+@single_flight()
+async def _geocode(location: str) -> tuple[str, float, float]:
     # Try lat,lon
     latlon = parse_latlon(location)
     if latlon:
+        if not (-90 <= latlon[0] <= 90 and -180 <= latlon[1] <= 180):
+            raise HTTPException(status_code=400, detail="Latitude must be within [-90, 90] and longitude within [-180, 180]")
         # Reverse geocode to a friendly name (optional)
-        name = reverse_geocode(latlon[0], latlon[1])
+        name = await reverse_geocode(latlon[0], latlon[1])
         return name or f"{latlon[0]:.4f},{latlon[1]:.4f}", latlon[0], latlon[1]
 
     # Try US ZIP via Zippopotam.us (no key, free)
     if is_us_zip(location):
         try:
-            r = requests.get(f"https://api.zippopotam.us/us/{location}", timeout=10)
+            r = await client.get(f"https://api.zippopotam.us/us/{location}", timeout=10)
             if r.status_code == 200:
                 data = r.json()
                 place = data["places"][0]
@@ -130,7 +306,7 @@ def geocode(location: str) -> tuple[str, float, float]:
             pass  # fallthrough
 
     # Fallback to Open-Meteo Geocoding
-    r = requests.get("https://geocoding-api.open-meteo.com/v1/search", params={"name": location, "count": 1, "language": "en"}, timeout=15)
+    r = await client.get("https://geocoding-api.open-meteo.com/v1/search", params={"name": location, "count": 1, "language": "en"}, timeout=15)
     if r.status_code != 200:
         raise HTTPException(status_code=502, detail="Geocoding failed")
     j = r.json()
@@ -146,9 +322,10 @@ def geocode(location: str) -> tuple[str, float, float]:
     name = ", ".join([p for p in name_parts if p])
     return name, float(top["latitude"]), float(top["longitude"])
 
-def reverse_geocode(lat: float, lon: float) -> str | None:
+@async_cached(REVERSE_GEOCODE_CACHE)
+async def reverse_geocode(lat: float, lon: float) -> str | None:
     try:
-        r = requests.get("https://geocoding-api.open-meteo.com/v1/reverse", params={"latitude":lat,"longitude":lon,"count":1}, timeout=10)
+        r = await client.get("https://geocoding-api.open-meteo.com/v1/reverse", params={"latitude":lat,"longitude":lon,"count":1}, timeout=10)
         if r.status_code == 200:
             j = r.json()
             results = j.get("results") or []
@@ -160,9 +337,61 @@ def reverse_geocode(lat: float, lon: float) -> str | None:
         return None
     return None
 
-def fetch_weather(lat: float, lon: float, dfrom: date, dto: date) -> dict:
+async def _fetch_daily(lat: float, lon: float, start: date, end: date, kind: str) -> dict:
+    base = "https://archive-api.open-meteo.com/v1/archive" if kind == "archive" else "https://api.open-meteo.com/v1/forecast"
+    params = {
+        "latitude": lat,
+        "longitude": lon,
+        "daily": "temperature_2m_min,temperature_2m_max,weathercode",
+        "timezone": "auto",
+        "start_date": start.isoformat(),
+        "end_date": end.isoformat(),
+    }
+    r = await client.get(base, params=params, timeout=20)
+    if r.status_code != 200:
+        raise HTTPException(status_code=502, detail=f"Weather API error ({kind})")
+    return r.json().get("daily") or {}
+
+@async_cached(ARCHIVE_CACHE, key=weather_key)
+@single_flight(key=weather_key)
+async def _fetch_settled_archive(lat: float, lon: float, start: date, end: date) -> dict:
+    return await _fetch_daily(lat, lon, start, end, "archive")
+
+@async_cached(RECENT_ARCHIVE_CACHE, key=weather_key)
+@single_flight(key=weather_key)
+async def _fetch_recent_archive(lat: float, lon: float, start: date, end: date) -> dict:
+    return await _fetch_daily(lat, lon, start, end, "archive")
+
+async def _fetch_archive(lat: float, lon: float, start: date, end: date) -> dict:
+    # only ranges old enough to be fully published are cached for good
+    if end <= date.today() - timedelta(days=ARCHIVE_SETTLE_DAYS):
+        return await _fetch_settled_archive(lat, lon, start, end)
+    return await _fetch_recent_archive(lat, lon, start, end)
+
+@async_cached(FORECAST_CACHE, key=weather_key)
+async def _fetch_forecast(lat: float, lon: float, start: date, end: date) -> dict:
+    return await _fetch_daily(lat, lon, start, end, "forecast")
+
+# not cached: this is the live reading
+async def _fetch_current(lat: float, lon: float) -> dict | None:
+    # Current weather (try forecast endpoint live); best effort only
+    try:
+        r = await client.get("https://api.open-meteo.com/v1/forecast", params={
+            "latitude": lat,
+            "longitude": lon,
+            "current_weather": "true",
+            "timezone": "auto"
+        }, timeout=10)
+        if r.status_code == 200:
+            return r.json().get("current_weather")
+    except Exception:
+        pass
+    return None
+
+async def fetch_weather(lat: float, lon: float, dfrom: date, dto: date) -> dict:
     """Fetch daily min/max temps and weathercode + current weather using Open-Meteo.
        Uses archive API if the entire range is in the past; forecast otherwise. Splits if needed.
+       All upstream calls are independent and issued concurrently.
     """
     today = date.today()
     parts: list[tuple[date,date,str]] = []
@@ -174,32 +403,22 @@ def fetch_weather(lat: float, lon: float, dfrom: date, dto: date) -> dict:
         parts.append((dfrom, today - timedelta(days=1), "archive"))
         parts.append((today, dto, "forecast"))
 
+    coros = [(_fetch_archive if kind == "archive" else _fetch_forecast)(lat, lon, start, end)
+             for start, end, kind in parts]
+    *dailies, current = await asyncio.gather(*coros, _fetch_current(lat, lon), return_exceptions=True)
+
     daily_dates: list[str] = []
     tmin: list[float] = []
     tmax: list[float] = []
     wcode: list[int] = []
 
-    for start, end, kind in parts:
-        base = "https://archive-api.open-meteo.com/v1/archive" if kind == "archive" else "https://api.open-meteo.com/v1/forecast"
-        params = {
-            "latitude": lat,
-            "longitude": lon,
-            "daily": "temperature_2m_min,temperature_2m_max,weathercode",
-            "timezone": "auto",
-            "start_date": start.isoformat(),
-            "end_date": end.isoformat(),
-            "current_weather": "true" if kind == "forecast" else "false",
-        }
-        r = requests.get(base, params=params, timeout=20)
-        if r.status_code != 200:
-            raise HTTPException(status_code=502, detail=f"Weather API error ({kind})")
-        j = r.json()
-        daily = j.get("daily") or {}
+    for daily in dailies:
+        if isinstance(daily, BaseException):
+            raise daily
         daily_dates += daily.get("time") or []
         tmin += daily.get("temperature_2m_min") or []
         tmax += daily.get("temperature_2m_max") or []
         wcode += daily.get("weathercode") or []
-        current = j.get("current_weather") if "current_weather" in j else None
 
     # Merge into dict
     out = {
@@ -208,26 +427,17 @@ def fetch_weather(lat: float, lon: float, dfrom: date, dto: date) -> dict:
         "daily": [{"date": d, "tmin_c": mn, "tmax_c": mx, "weathercode": int(wc) if wc is not None else None}
                   for d, mn, mx, wc in zip(daily_dates, tmin, tmax, wcode)]
     }
-    # Current weather (try forecast endpoint live)
-    try:
-        r = requests.get("https://api.open-meteo.com/v1/forecast", params={
-            "latitude": lat,
-            "longitude": lon,
-            "current_weather": "true",
-            "timezone": "auto"
-        }, timeout=10)
-        if r.status_code == 200:
-            out["current_weather"] = r.json().get("current_weather")
-    except Exception:
-        pass
+    if current is not None and not isinstance(current, BaseException):
+        out["current_weather"] = current
     return out
 
 # ---------------- Optional APIs ----------------
-def wiki_summary(place: str) -> dict | None:
+@async_cached(WIKI_CACHE)
+async def wiki_summary(place: str) -> dict | None:
     # naive sanitization
     page = place.strip().replace(" ", "_")
     try:
-        r = requests.get(f"https://en.wikipedia.org/api/rest_v1/page/summary/{page}", timeout=10)
+        r = await client.get(f"https://en.wikipedia.org/api/rest_v1/page/summary/{page}", timeout=10)
         if r.status_code == 200:
             j = r.json()
             return {
@@ -239,12 +449,12 @@ def wiki_summary(place: str) -> dict | None:
         return None
     return None
 
-def youtube_search(place: str) -> dict:
+async def youtube_search(place: str) -> dict:
     api_key = settings.YOUTUBE_API_KEY
     if api_key:
         # Use official API
         try:
-            r = requests.get("https://www.googleapis.com/youtube/v3/search", params={
+            r = await client.get("https://www.googleapis.com/youtube/v3/search", params={
                 "part": "snippet",
                 "q": place,
                 "type": "video",
@@ -263,7 +473,7 @@ def youtube_search(place: str) -> dict:
         except Exception:
             pass
     # Fallback to share a search URL
-    return {"mode":"link","search_url": f"https://www.youtube.com/results?search_query={requests.utils.quote(place)}"}
+    return {"mode":"link","search_url": f"https://www.youtube.com/results?search_query={quote(place)}"}
 
 def map_image(lat: float, lon: float) -> dict:
     key = settings.GOOGLE_STATIC_MAPS_KEY
@@ -276,8 +486,32 @@ def map_image(lat: float, lon: float) -> dict:
     return {"provider":"openstreetmap","url": osm}
 
 # ---------------- Routes ----------------
+BULK_MAX = 50
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global client
+    client = httpx.AsyncClient(
+        timeout=20,
+        # pool limits live on the transport; keep-alive reuse avoids repeat TLS handshakes
+        transport=httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            retries=2,  # connection failures only
+        ),
+        headers={"User-Agent": USER_AGENT},
+        # requests followed redirects by default; Wikipedia answers alias titles with a 302
+        follow_redirects=True,
+    )
+    try:
+        yield
+    finally:
+        await client.aclose()
+        client = None
+
+app = FastAPI(title="WeatherWise API", version="1.0", lifespan=lifespan, default_response_class=ORJSONResponse)
 
-app = FastAPI(title="WeatherWise API", version="1.0")
+# Request-scoped DB session
+app.add_middleware(DBSessionMiddleware)
 
 # CORS
 origins = [o.strip() for o in settings.CORS_ORIGINS.split(",") if o.strip()]
@@ -290,54 +524,36 @@ app.add_middleware(
 )
 
 @app.get("/api/health")
-def health():
+async def health():
     return {"ok": True, "time": datetime.utcnow().isoformat()}
 
 @app.post("/api/requests", response_model=RequestOut)
-def create_request(payload: CreateRequest, db: Session = Depends(get_db)):
+async def create_request(payload: CreateRequest, db: Session = Depends(get_db)):
     # Validate range
     clamp_days(payload.date_from, payload.date_to, max_days=31)
 
     # Geocode
-    resolved_name, lat, lon = geocode(payload.location)
+    resolved_name, lat, lon = await geocode(payload.location)
 
     # Fetch weather
-    weather = fetch_weather(lat, lon, payload.date_from, payload.date_to)
-
-    # Store
-    rec = WeatherRequest(
-        location_input=payload.location,
-        resolved_name=resolved_name,
-        latitude=lat,
-        longitude=lon,
-        date_from=payload.date_from,
-        date_to=payload.date_to,
-        weather_json=json.dumps(weather, ensure_ascii=False),
-    )
-    db.add(rec)
-    db.commit()
-    db.refresh(rec)
-
-    return RequestOut(
-        id=rec.id,
-        created_at=rec.created_at,
-        location_input=rec.location_input,
-        resolved_name=rec.resolved_name,
-        latitude=rec.latitude,
-        longitude=rec.longitude,
-        date_from=rec.date_from,
-        date_to=rec.date_to,
-        provider=rec.provider,
-        weather=json.loads(rec.weather_json),
-        notes=rec.notes
-    )
-
-@app.get("/api/requests", response_model=list[RequestOut])
-def list_requests(limit: int = Query(50, le=500), db: Session = Depends(get_db)):
-    rows = db.query(WeatherRequest).order_by(WeatherRequest.id.desc()).limit(limit).all()
-    out = []
-    for rec in rows:
-        out.append(RequestOut(
+    weather = await fetch_weather(lat, lon, payload.date_from, payload.date_to)
+
+    # Store; Session calls are blocking, so they run in a worker thread
+    def store() -> RequestOut:
+        rec = WeatherRequest(
+            location_input=payload.location,
+            resolved_name=resolved_name,
+            latitude=lat,
+            longitude=lon,
+            date_from=payload.date_from,
+            date_to=payload.date_to,
+            weather=weather,
+        )
+        db.add(rec)
+        db.commit()
+        db.refresh(rec)
+
+        return RequestOut(
             id=rec.id,
             created_at=rec.created_at,
             location_input=rec.location_input,
@@ -347,9 +563,59 @@ def list_requests(limit: int = Query(50, le=500), db: Session = Depends(get_db))
             date_from=rec.date_from,
             date_to=rec.date_to,
             provider=rec.provider,
-            weather=json.loads(rec.weather_json),
+            weather=rec.weather,
             notes=rec.notes
-        ))
+        )
+
+    return await asyncio.to_thread(store)
+
+@app.post("/api/requests/bulk", response_model=list[RequestOut])
+async def create_requests_bulk(payloads: list[CreateRequest], db: Session = Depends(get_db)):
+    if len(payloads) > BULK_MAX:
+        raise HTTPException(status_code=400, detail=f"Too many requests ({len(payloads)}). Max {BULK_MAX} per call.")
+    for payload in payloads:
+        clamp_days(payload.date_from, payload.date_to, max_days=31)
+
+    async def resolve(payload: CreateRequest) -> dict:
+        resolved_name, lat, lon = await geocode(payload.location)
+        weather = await fetch_weather(lat, lon, payload.date_from, payload.date_to)
+        return {
+            "location_input": payload.location,
+            "resolved_name": resolved_name,
+            "latitude": lat,
+            "longitude": lon,
+            "date_from": payload.date_from,
+            "date_to": payload.date_to,
+            "weather": weather,
+        }
+
+    tasks = [asyncio.ensure_future(resolve(p)) for p in payloads]
+    try:
+        rows = await asyncio.gather(*tasks)
+    except BaseException:
+        # first failure fails the batch; don't leave the other lookups running
+        for task in tasks:
+            task.cancel()
+        raise
+    if not rows:
+        return []
+
+    # one multi-row INSERT ... RETURNING in a single transaction instead of add()/commit() per row
+    def store() -> list[RequestOut]:
+        # sort_by_parameter_order keeps RETURNING rows aligned with the payload order
+        recs = db.scalars(insert(WeatherRequest).returning(WeatherRequest, sort_by_parameter_order=True), rows).all()
+        out = [RequestOut.model_validate(rec, from_attributes=True) for rec in recs]
+        db.commit()
+        return out
+
+    return await asyncio.to_thread(store)
+
+@app.get("/api/requests", response_model=list[RequestOut])
+def list_requests(limit: int = Query(50, le=500), db: Session = Depends(get_db)):
+    # Core column projection: rows come back as plain tuples, skipping ORM
+    # instance construction and identity-map bookkeeping.
+    stmt = select(*REQUEST_OUT_COLUMNS).order_by(WeatherRequest.id.desc()).limit(limit)
+    out = [RequestOut(**row._mapping) for row in db.execute(stmt)]
     return out
 
 @app.get("/api/requests/{rid}", response_model=RequestOut)
@@ -367,83 +633,121 @@ def get_request(rid: int, db: Session = Depends(get_db)):
         date_from=rec.date_from,
         date_to=rec.date_to,
         provider=rec.provider,
-        weather=json.loads(rec.weather_json),
+        weather=rec.weather,
         notes=rec.notes
     )
 
+def write_request(db: Session, rid: int, values: dict[str, t.Any]) -> RequestOut | None:
+    """UPDATE ... RETURNING the given values (plain SELECT when empty) and end the
+       transaction, so nothing stays checked out while the caller awaits upstream calls.
+       Blocking; run it via asyncio.to_thread from async handlers."""
+    if values:
+        stmt = update(WeatherRequest).where(WeatherRequest.id == rid).values(**values).returning(*REQUEST_OUT_COLUMNS)
+    else:
+        stmt = select(*REQUEST_OUT_COLUMNS).where(WeatherRequest.id == rid)
+    row = db.execute(stmt).first()
+    db.commit()
+    return RequestOut(**row._mapping) if row else None
+
 @app.put("/api/requests/{rid}", response_model=RequestOut)
-def update_request(rid: int, patch: UpdateRequest, db: Session = Depends(get_db)):
-    rec = db.get(WeatherRequest, rid)
-    if not rec:
+async def update_request(rid: int, patch: UpdateRequest, db: Session = Depends(get_db)):
+    if patch.location is None and patch.date_from is None and patch.date_to is None:
+        # notes-only patch: one UPDATE ... RETURNING, no re-geocode / weather re-fetch
+        out = await asyncio.to_thread(write_request, db, rid, {} if patch.notes is None else {"notes": patch.notes})
+        if out is None:
+            raise HTTPException(status_code=404, detail="Not found")
+        return out
+
+    # read, then release the session before any upstream call
+    cur = await asyncio.to_thread(write_request, db, rid, {})
+    if cur is None:
         raise HTTPException(status_code=404, detail="Not found")
-    # compute new values
-    new_loc = patch.location if patch.location is not None else rec.location_input
-    new_from = patch.date_from if patch.date_from is not None else rec.date_from
-    new_to = patch.date_to if patch.date_to is not None else rec.date_to
-    if new_to < new_from:
-        raise HTTPException(status_code=400, detail="date_to cannot be earlier than date_from")
-    clamp_days(new_from, new_to, max_days=31)
-
-    resolved_name, lat, lon = geocode(new_loc)
-    weather = fetch_weather(lat, lon, new_from, new_to)
-
-    rec.location_input = new_loc
-    rec.resolved_name = resolved_name
-    rec.latitude = lat
-    rec.longitude = lon
-    rec.date_from = new_from
-    rec.date_to = new_to
-    rec.weather_json = json.dumps(weather, ensure_ascii=False)
+    # only re-fetch when the patch actually differs from what is stored
+    loc_changed = patch.location is not None and patch.location != cur.location_input
+    from_changed = patch.date_from is not None and patch.date_from != cur.date_from
+    to_changed = patch.date_to is not None and patch.date_to != cur.date_to
+
+    values: dict[str, t.Any] = {}
+    if loc_changed or from_changed or to_changed:
+        # compute new values
+        new_loc = patch.location if loc_changed else cur.location_input
+        new_from = patch.date_from if from_changed else cur.date_from
+        new_to = patch.date_to if to_changed else cur.date_to
+        if new_to < new_from:
+            raise HTTPException(status_code=400, detail="date_to cannot be earlier than date_from")
+        clamp_days(new_from, new_to, max_days=31)
+
+        if loc_changed:
+            resolved_name, lat, lon = await geocode(new_loc)
+        else:
+            resolved_name, lat, lon = cur.resolved_name, cur.latitude, cur.longitude
+        weather = await fetch_weather(lat, lon, new_from, new_to)
+
+        values.update(
+            location_input=new_loc,
+            resolved_name=resolved_name,
+            latitude=lat,
+            longitude=lon,
+            date_from=new_from,
+            date_to=new_to,
+            weather=weather,
+        )
     if patch.notes is not None:
-        rec.notes = patch.notes
-    db.commit()
-    db.refresh(rec)
-    return RequestOut(
-        id=rec.id,
-        created_at=rec.created_at,
-        location_input=rec.location_input,
-        resolved_name=rec.resolved_name,
-        latitude=rec.latitude,
-        longitude=rec.longitude,
-        date_from=rec.date_from,
-        date_to=rec.date_to,
-        provider=rec.provider,
-        weather=json.loads(rec.weather_json),
-        notes=rec.notes
-    )
+        values["notes"] = patch.notes
+    if not values:
+        return cur
+    out = await asyncio.to_thread(write_request, db, rid, values)
+    if out is None:  # deleted while we were fetching
+        raise HTTPException(status_code=404, detail="Not found")
+    return out
 
 @app.delete("/api/requests/{rid}")
 def delete_request(rid: int, db: Session = Depends(get_db)):
-    rec = db.get(WeatherRequest, rid)
-    if not rec:
+    # delete by key without loading the row (and its weather payload) first
+    result = db.execute(delete(WeatherRequest).where(WeatherRequest.id == rid))
+    if not result.rowcount:
         raise HTTPException(status_code=404, detail="Not found")
-    db.delete(rec)
     db.commit()
     return {"deleted": rid}
 
 # ----- Optional: info, media, maps -----
 @app.get("/api/info")
-def info_for_place(q: str = Query(..., description="Place name for Wikipedia lookup")):
-    info = wiki_summary(q)
+async def info_for_place(q: str = Query(..., description="Place name for Wikipedia lookup")):
+    info = await wiki_summary(q)
     if not info:
         raise HTTPException(status_code=404, detail="No info found")
     return info
 
 @app.get("/api/media/youtube")
-def media_youtube(q: str):
-    return youtube_search(q)
+async def media_youtube(q: str):
+    return await youtube_search(q)
 
 @app.get("/api/map")
-def map_for_coords(lat: float, lon: float):
+async def map_for_coords(lat: float, lon: float):
     return map_image(lat, lon)
 
 # ----- Data Export -----
+CSV_CHUNK_ROWS = 1000
+
+# markdown export templates, filled per row / per daily entry with format_map
+MD_HEADER = "# WeatherWise Export\n\n"
+MD_ROW_HEADER = (
+    "## Request #{id} — {resolved_name} ({latitude:.4f},{longitude:.4f})\n"
+    "- Entered: **{location_input}**\n"
+    "- Range: **{date_from} → {date_to}**\n"
+    "\n"
+    "| Date | Tmin (°C) | Tmax (°C) | Code |\n"
+    "|---|---:|---:|---:|\n"
+)
+MD_DAY = "| {date} | {tmin_c} | {tmax_c} | {weathercode} |\n"
+
 def records_for_export(db: Session):
-    rows = db.query(WeatherRequest).order_by(WeatherRequest.id.asc()).all()
-    for r in rows:
+    # yield_per fetches rows in chunks instead of hydrating the whole table up front
+    stmt = select(WeatherRequest).order_by(WeatherRequest.id.asc()).execution_options(yield_per=200)
+    for r in db.execute(stmt).scalars():
         yield {
             "id": r.id,
-            "created_at": r.created_at.isoformat(),
+            "created_at": r.created_at.isoformat(timespec="seconds"),
             "location_input": r.location_input,
             "resolved_name": r.resolved_name,
             "latitude": r.latitude,
@@ -451,91 +755,131 @@ def records_for_export(db: Session):
             "date_from": r.date_from.isoformat(),
             "date_to": r.date_to.isoformat(),
             "provider": r.provider,
-            "weather": json.loads(r.weather_json),
+            "weather": r.weather,
             "notes": r.notes
         }
 
+def build_markdown(rows: t.Iterable[dict]) -> str:
+    parts = [MD_HEADER]
+    for i, row in enumerate(rows):
+        if i:
+            parts.append("\n")
+        parts.append(MD_ROW_HEADER.format_map(row))
+        parts.extend(MD_DAY.format_map(d) for d in row["weather"].get("daily", []))
+    return "".join(parts)
+
+def build_pdf(rows: t.Iterable[dict]) -> bytes:
+    """Render export rows as a simple tabular PDF: one page group per request,
+       daily temps laid out as a reportlab Table (header repeats across pages)."""
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+    styles = getSampleStyleSheet()
+    table_style = TableStyle([
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), 10),
+        ("ALIGN", (1, 0), (-1, -1), "RIGHT"),
+        ("LINEBELOW", (0, 0), (-1, 0), 0.5, colors.black),
+    ])
+
+    story: list = []
+    for row in rows:
+        if story:
+            story.append(PageBreak())
+        story.append(Paragraph(f"WeatherWise Export — Request #{row['id']}", styles["Heading2"]))
+        # Paragraph parses markup; upstream place names are plain text
+        story.append(Paragraph(escape(f"{row['resolved_name']} ({row['latitude']:.4f},{row['longitude']:.4f})"), styles["Normal"]))
+        story.append(Paragraph(f"Range: {row['date_from']} → {row['date_to']}", styles["Normal"]))
+        story.append(Spacer(1, 10))
+        data = [["Date", "Tmin (°C)", "Tmax (°C)", "Code"]]
+        data += [[d["date"], d["tmin_c"], d["tmax_c"], d.get("weathercode", "")] for d in row["weather"].get("daily", [])]
+        story.append(Table(data, colWidths=[108, 90, 90, 90], hAlign="LEFT", style=table_style, repeatRows=1))
+    if not story:
+        story.append(Paragraph("WeatherWise Export — no requests", styles["Heading2"]))
+
+    buffer = io.BytesIO()
+    SimpleDocTemplate(buffer, pagesize=letter, title="WeatherWise Export").build(story)
+    return buffer.getvalue()
+
 @app.get("/api/export")
-def export_data(format: str = Query("json", pattern="^(json|csv|md|pdf)$"), db: Session = Depends(get_db)):
-    data = list(records_for_export(db))
+async def export_data(format: str = Query("json", pattern="^(json|csv|md|pdf)$"), db: Session = Depends(get_db)):
     if format == "json":
-        return JSONResponse(content=data)
+        def gen_json():
+            yield b"["
+            for i, row in enumerate(records_for_export(db)):
+                yield (b"," if i else b"") + orjson.dumps(row)
+            yield b"]"
+        return StreamingResponse(gen_json(), media_type="application/json")
     elif format == "csv":
         def gen():
-            # flatten a few top-level fields
+            # flatten a few top-level fields; rows are buffered and flushed every CSV_CHUNK_ROWS
             fieldnames = ["id","created_at","location_input","resolved_name","latitude","longitude","date_from","date_to","provider","notes"]
-            writer = csv.DictWriter(io.StringIO(), fieldnames=fieldnames)
             sio = io.StringIO()
-            writer = csv.DictWriter(sio, fieldnames=fieldnames)
-            writer.writeheader()
+            writer = csv.writer(sio)
+            writer.writerow(fieldnames)
+            for i, row in enumerate(records_for_export(db), start=1):
+                writer.writerow([row[k] for k in fieldnames])
+                if i % CSV_CHUNK_ROWS == 0:
+                    yield sio.getvalue()
+                    sio.seek(0); sio.truncate(0)
             yield sio.getvalue()
-            sio.seek(0); sio.truncate(0)
-            for row in data:
-                writer.writerow({k: row.get(k) for k in fieldnames})
-                yield sio.getvalue()
-                sio.seek(0); sio.truncate(0)
         return StreamingResponse(gen(), media_type="text/csv", headers={"Content-Disposition":"attachment; filename=weatherwise.csv"})
     elif format == "md":
-        lines = ["# WeatherWise Export", ""]
-        for row in data:
-            lines.append(f"## Request #{row['id']} — {row['resolved_name']} ({row['latitude']:.4f},{row['longitude']:.4f})")
-            lines.append(f"- Entered: **{row['location_input']}**")
-            lines.append(f"- Range: **{row['date_from']} → {row['date_to']}**")
-            lines.append("")
-            lines.append("| Date | Tmin (°C) | Tmax (°C) | Code |")
-            lines.append("|---|---:|---:|---:|")
-            for d in row["weather"].get("daily", []):
-                lines.append(f"| {d['date']} | {d['tmin_c']} | {d['tmax_c']} | {d.get('weathercode','')} |")
-            lines.append("")
-        md = "\n".join(lines)
+        # the query loop and string build run off the event loop, like the PDF
+        md = await asyncio.to_thread(build_markdown, records_for_export(db))
         return PlainTextResponse(md, media_type="text/markdown")
     else:  # pdf
-        # Generate a very simple tabular PDF using reportlab
-        from reportlab.lib.pagesizes import letter
-        from reportlab.pdfgen import canvas
-        from reportlab.lib.units import inch
-
-        buffer = io.BytesIO()
-        c = canvas.Canvas(buffer, pagesize=letter)
-        width, height = letter
-
-        for idx, row in enumerate(data, start=1):
-            c.setFont("Helvetica-Bold", 14)
-            c.drawString(72, height - 72, f"WeatherWise Export — Request #{row['id']}")
-            c.setFont("Helvetica", 10)
-            c.drawString(72, height - 90, f"{row['resolved_name']} ({row['latitude']:.4f},{row['longitude']:.4f})")
-            c.drawString(72, height - 105, f"Range: {row['date_from']} → {row['date_to']}")
-            y = height - 130
-            c.setFont("Helvetica-Bold", 10)
-            c.drawString(72, y, "Date")
-            c.drawString(180, y, "Tmin (°C)")
-            c.drawString(270, y, "Tmax (°C)")
-            c.drawString(360, y, "Code")
-            y -= 14
-            c.setFont("Helvetica", 10)
-            for d in row["weather"].get("daily", []):
-                if y < 72:
-                    c.showPage()
-                    y = height - 72
-                c.drawString(72, y, str(d["date"]))
-                c.drawRightString(240, y, f"{d['tmin_c']}")
-                c.drawRightString(330, y, f"{d['tmax_c']}")
-                c.drawRightString(420, y, str(d.get("weathercode","")))
-                y -= 12
-            c.showPage()
-        c.save()
-        buffer.seek(0)
+        # reportlab is CPU-bound; keep it off the event loop
+        buffer = io.BytesIO(await asyncio.to_thread(build_pdf, records_for_export(db)))
         return StreamingResponse(buffer, media_type="application/pdf", headers={"Content-Disposition":"attachment; filename=weatherwise.pdf"})
 
-from fastapi.staticfiles import StaticFiles
-import os
-
+# ----- Static UI -----
+# The frontend is scanned once at import: bytes, ETag and headers are served from
+# memory, so requests never stat or re-read files. Restart to pick up UI changes.
 frontend_dir = os.path.join(os.path.dirname(__file__), "../frontend")
-app.mount("/ui", StaticFiles(directory=frontend_dir, html=True), name="ui")
+HASHED_ASSET_RE = re.compile(r"\.[0-9a-f]{8,}\.\w+$")
+
+def load_static(directory: str) -> dict[str, tuple[bytes, dict[str, str]]]:
+    assets: dict[str, tuple[bytes, dict[str, str]]] = {}
+    for root_dir, _dirs, files in os.walk(directory):
+        for fname in files:
+            full = os.path.join(root_dir, fname)
+            rel = os.path.relpath(full, directory).replace(os.sep, "/")
+            with open(full, "rb") as fh:
+                body = fh.read()
+            media_type = mimetypes.guess_type(fname)[0] or "application/octet-stream"
+            if media_type.startswith("text/"):
+                media_type += "; charset=utf-8"
+            headers = {
+                "ETag": f'"{hashlib.sha256(body).hexdigest()}"',
+                "Last-Modified": formatdate(os.path.getmtime(full), usegmt=True),
+                # content-hashed filenames never change; anything else must revalidate soon
+                "Cache-Control": "public, max-age=31536000, immutable" if HASHED_ASSET_RE.search(fname) else "public, max-age=60",
+                "Content-Type": media_type,
+            }
+            assets[rel] = (body, headers)
+    return assets
+
+STATIC_ASSETS = load_static(frontend_dir)
+
+@app.api_route("/ui", methods=["GET", "HEAD"], include_in_schema=False)
+@app.api_route("/ui/{path:path}", methods=["GET", "HEAD"], include_in_schema=False)
+async def ui(request: Request, path: str = ""):
+    path = path.strip("/")
+    asset = STATIC_ASSETS.get(path) or STATIC_ASSETS.get(f"{path}/index.html" if path else "index.html")
+    if asset is None:
+        raise HTTPException(status_code=404, detail="Not found")
+    body, headers = asset
+    inm = request.headers.get("if-none-match")
+    if inm and (inm.strip() == "*" or headers["ETag"] in (tag.strip() for tag in inm.split(","))):
+        return Response(status_code=304, headers={k: v for k, v in headers.items() if k != "Content-Type"})
+    return Response(body, headers=headers)
 
 # Root helpful message
 @app.get("/")
-def root():
+async def root():
     return {
         "name": "WeatherWise API",
         "message": "Use /api/requests (POST) to fetch & store weather. See README for details."